@@ -29,6 +29,15 @@ class TestContainerCompiled(unittest.TestCase):
         self.assertIsInstance(service.random, RandomService)
         self.assertEqual(service.start, 10)
 
+    def test_warmup_skips_singletons_only_known_to_context(self):
+        class Unregistered: ...
+
+        with self.assertWarns(DeprecationWarning):
+            self.container.context.init_target(Unregistered, ServiceLifetime.SINGLETON)
+
+        self.container.warmup()
+        self.assertIsInstance(self.container.get(SomeService), SomeService)
+
     def test_compiled_works_with_interfaces(self):
         self.container.abstract(FooBase)
         self.container.register(FooBar)
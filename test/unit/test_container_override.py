@@ -117,3 +117,100 @@ class TestContainerOverride(unittest.TestCase):
 
         with self.container.override.service(FooBase, new=foobaz):
             self.assertEqual(self.container.get(FooBase).foo, "baz")
+
+    def test_nested_override_restores_outer_override(self):
+        self.container.register(RandomService)
+
+        outer_mock = MagicMock()
+        inner_mock = MagicMock()
+
+        with self.container.override.service(target=RandomService, new=outer_mock):
+            with self.container.override.service(target=RandomService, new=inner_mock):
+                self.assertIs(self.container.get(RandomService), inner_mock)
+
+            self.assertIs(self.container.get(RandomService), outer_mock)
+
+        self.assertIsInstance(self.container.get(RandomService), RandomService)
+
+    def test_delete_only_affects_its_own_target(self):
+        overrides = {}
+        mock1, mock2 = MagicMock(), MagicMock()
+        override_mgr = OverrideManager(overrides, lambda _klass, _qualifier: True)
+
+        override_mgr.set(RandomService, new=mock1)
+        override_mgr.set(FooBar, new=mock2)
+        override_mgr.delete(RandomService)
+        self.assertEqual(overrides, {(FooBar, None): mock2})
+
+        override_mgr.delete(FooBar)
+        override_mgr.delete(FooBar)
+        self.assertEqual(overrides, {})
+
+    def test_delete_restores_earlier_override_of_same_target(self):
+        overrides = {}
+        mock1, mock2, mock3 = MagicMock(), MagicMock(), MagicMock()
+        override_mgr = OverrideManager(overrides, lambda _klass, _qualifier: True)
+
+        override_mgr.set(RandomService, new=mock1)
+        override_mgr.set(FooBar, new=mock2)
+        override_mgr.set(RandomService, new=mock3)
+
+        override_mgr.delete(RandomService)
+        self.assertEqual(overrides, {(RandomService, None): mock1, (FooBar, None): mock2})
+
+        override_mgr.delete(RandomService)
+        self.assertEqual(overrides, {(FooBar, None): mock2})
+
+    def test_services_applies_nothing_when_an_override_is_invalid(self):
+        self.container.register(RandomService)
+        random_mock = MagicMock()
+
+        with self.container.override.service(target=RandomService, new=random_mock):
+            overrides = [
+                ServiceOverride(target=unittest.TestCase, qualifier=None, new=MagicMock()),
+                ServiceOverride(target=RandomService, qualifier=None, new=MagicMock()),
+            ]
+            with self.assertRaises(UnknownOverrideRequestedError):
+                with self.container.override.services(overrides=overrides):
+                    pass
+
+            self.assertIs(self.container.get(RandomService), random_mock)
+
+    def test_valid_override_check_is_cached(self):
+        is_valid_override = MagicMock(return_value=True)
+        override_mgr = OverrideManager({}, is_valid_override)
+
+        for _ in range(3):
+            override_mgr.set(RandomService, new=MagicMock())
+            override_mgr.delete(RandomService)
+
+        is_valid_override.assert_called_once_with(RandomService, None)
+
+    def test_override_service_as_decorator(self):
+        self.container.register(RandomService)
+        random_mock = MagicMock()
+
+        @self.container.override.service(target=RandomService, new=random_mock)
+        def target():
+            return self.container.get(RandomService)
+
+        self.assertIs(target(), random_mock)
+        self.assertEqual(target.__name__, "target")
+        self.assertIsInstance(self.container.get(RandomService), RandomService)
+
+    def test_override_contexts_are_slotted(self):
+        self.container.register(RandomService)
+
+        self.assertFalse(hasattr(self.container.override.service(target=RandomService, new=MagicMock()), "__dict__"))
+        self.assertFalse(hasattr(self.container.override.services(overrides=[]), "__dict__"))
+
+    def test_override_with_falsy_value(self):
+        self.container.register(RandomService)
+
+        @self.container.autowire
+        def target(random_service: RandomService):
+            return random_service
+
+        with self.container.override.service(target=RandomService, new=[]):
+            self.assertEqual(self.container.get(RandomService), [])
+            self.assertEqual(target(), [])
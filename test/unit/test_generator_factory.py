@@ -1,3 +1,4 @@
+import asyncio
 from typing import AsyncIterator, Iterator, NewType
 
 import pytest
@@ -191,3 +192,24 @@ def test_raises_errors() -> None:
     assert len(e.value.errors) == 1
     assert isinstance(e.value.errors[0], ValueError)
     assert str(e.value.errors[0]) == "boom"
+
+
+async def test_concurrent_async_autowire_with_unknown_dependency() -> None:
+    Something = NewType("Something", str)
+
+    class Unknown: ...
+
+    async def some_factory() -> AsyncIterator[Something]:
+        await asyncio.sleep(0)
+        yield Something("foo")
+
+    c = DependencyContainer(ParameterBag())
+    c.register(some_factory, lifetime=ServiceLifetime.TRANSIENT)
+
+    @c.autowire
+    async def target(smth: Something, unknown: Unknown = None) -> Something:
+        assert unknown is None
+        return smth
+
+    assert await asyncio.gather(target(), target()) == [Something("foo"), Something("foo")]
+    await c.aclose()
@@ -21,3 +21,12 @@ class InitializationContextTest(unittest.TestCase):
         self.assertEqual(
             self.context.dependencies[InitializationContextTest], {"foo": AnnotatedParameter(klass=DbService)}
         )
+
+    def test_remove_dependency_type(self):
+        self.context.init_target(InitializationContextTest)
+        self.context.add_dependency(InitializationContextTest, "foo", AnnotatedParameter(klass=DbService))
+        self.context.add_dependency(InitializationContextTest, "bar", AnnotatedParameter(klass=str))
+
+        self.context.remove_dependency_type(InitializationContextTest, DbService)
+
+        self.assertEqual(self.context.dependencies[InitializationContextTest], {"bar": AnnotatedParameter(klass=str)})
@@ -21,6 +21,13 @@ class TestParameterBag(unittest.TestCase):
         self.assertEqual(self.bag.get(templated_str), "Number: 42")
         self.assertEqual(self.bag.get(TemplatedString("${param1}")), "42")
 
+    def test_get_templated_string_subclass_is_interpolated(self):
+        class CustomTemplatedString(TemplatedString): ...
+
+        self.bag.put("param1", 42)
+
+        self.assertEqual(self.bag.get(CustomTemplatedString("Number: ${param1}")), "Number: 42")
+
     def test_get_unknown_parameter(self):
         with self.assertRaises(UnknownParameterError):
             self.bag.get("unknown_param")
@@ -51,6 +58,21 @@ class TestParameterBag(unittest.TestCase):
         self.assertEqual(self.bag.get(TemplatedString("${foo}-${foo}")), "bar-bar")
         self.assertEqual(self.bag._ParameterBag__cache, {"${foo}-${foo}": "bar-bar"})
 
+    def test_interpolate_without_placeholders(self):
+        self.assertEqual(self.bag.get(TemplatedString("no placeholders {here}")), "no placeholders {here}")
+        self.assertEqual(self.bag.get(TemplatedString("$ {not_a_placeholder}")), "$ {not_a_placeholder}")
+
+    def test_interpolate_braces_and_format_syntax_are_literal(self):
+        self.bag.put("a.b", "x")
+        self.bag.put("0", "y")
+
+        self.assertEqual(self.bag.get(TemplatedString("{${a.b}}-{}-${0}")), "{x}-{}-y")
+
+    def test_interpolate_unterminated_placeholder_is_literal(self):
+        self.bag.put("name", "Bob")
+
+        self.assertEqual(self.bag.get(TemplatedString("${name} ${name")), "Bob ${name")
+
     def test_get_parameter_unknown(self):
         with self.assertRaises(UnknownParameterError) as context:
             self.bag.get("name")
@@ -77,8 +99,9 @@ class TestParameterBag(unittest.TestCase):
         self.assertEqual({"Hi ${name}": "Hi Bob", "Hi from ${env}": "Hi from test"}, self.bag._ParameterBag__cache)
 
         self.bag.put("env", "prod")
-        self.assertEqual({"Hi ${name}": "Hi Bob"}, self.bag._ParameterBag__cache)  # Check that entry was removed.
+        self.assertEqual({}, self.bag._ParameterBag__cache)  # Check that entries were removed.
 
+        self.assertEqual(self.bag.get(TemplatedString("Hi ${name}")), "Hi Bob")
         self.assertEqual(self.bag.get(TemplatedString("Hi from ${env}")), "Hi from prod")
         self.assertEqual({"Hi ${name}": "Hi Bob", "Hi from ${env}": "Hi from prod"}, self.bag._ParameterBag__cache)
 
@@ -1,5 +1,5 @@
 import unittest
-from typing import NewType
+from typing import AsyncIterator, Iterator, NewType
 
 from typing_extensions import Annotated
 from wireup import Inject, ServiceLifetime, Wire
@@ -8,7 +8,7 @@ from wireup.errors import (
     FactoryDuplicateServiceRegistrationError,
     FactoryReturnTypeIsEmptyError,
 )
-from wireup.ioc.service_registry import ServiceRegistry
+from wireup.ioc.service_registry import FactoryType, ServiceRegistry
 from wireup.ioc.types import AnnotatedParameter, ParameterWrapper
 
 from test.unit.services.no_annotations.random.random_service import RandomService
@@ -125,6 +125,21 @@ class TestServiceRegistry(unittest.TestCase):
 
         self.assertTrue(self.registry.is_impl_singleton(Y))
 
+    def test_register_generator_factory_methods(self) -> None:
+        class Factories:
+            def make_random(self) -> Iterator[RandomService]:
+                yield RandomService()
+
+            async def make_service(self) -> AsyncIterator[MyService]:
+                yield MyService()
+
+        factories = Factories()
+        self.registry.register_factory(factories.make_random, lifetime=ServiceLifetime.SINGLETON)
+        self.registry.register_factory(factories.make_service, lifetime=ServiceLifetime.SINGLETON)
+
+        self.assertEqual(self.registry.factory_functions[RandomService, None].factory_type, FactoryType.GENERATOR)
+        self.assertEqual(self.registry.factory_functions[MyService, None].factory_type, FactoryType.ASYNC_GENERATOR)
+
 
 class MyService:
     pass
@@ -6,6 +6,7 @@ from typing_extensions import Annotated
 from wireup import Inject
 from wireup.ioc.types import AnnotatedParameter, InjectableType, ParameterWrapper, ServiceQualifier
 from wireup.ioc.util import (
+    _get_signature_parameters,
     is_type_autowireable,
     param_get_annotation,
 )
@@ -73,6 +74,15 @@ class TestUtilityFunctions(unittest.TestCase):
         self.assertFalse(is_type_autowireable(None))
         self.assertFalse(is_type_autowireable(Union[str, int, None]))
 
+    def test_get_signature_parameters_is_cached(self):
+        def inner(_a: int, _b: str = "b"): ...
+
+        params = _get_signature_parameters(inner)
+
+        self.assertEqual([name for name, _ in params], ["_a", "_b"])
+        self.assertEqual(params[1][1].default, "b")
+        self.assertIs(_get_signature_parameters(inner), params)
+
     def test_annotated_parameter_hash_equality(self):
         self.assertEqual(
             hash(AnnotatedParameter(AnnotatedParameter, ServiceQualifier("wow"))),
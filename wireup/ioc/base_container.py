@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+_NOT_FOUND: Any = object()
+"""Sentinel for dict lookups where None or any other falsy object is a legitimate value."""
+
 
 class BaseContainer:
     """Base Container class providing core functionality."""
@@ -80,7 +83,8 @@ class BaseContainer:
         if param.klass:
             obj_id = param.klass, param.qualifier_value
 
-            if res := self._overrides.get(obj_id):
+            # Overrides are generally only active in tests. Avoid the lookup entirely when there are none.
+            if self._overrides and (res := self._overrides.get(obj_id, _NOT_FOUND)) is not _NOT_FOUND:
                 return res, True
 
             if self._registry.is_interface_known(param.klass):
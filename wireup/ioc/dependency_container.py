@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
 from wireup.ioc._exit_stack import async_clean_exit_stack, clean_exit_stack
-from wireup.ioc.base_container import BaseContainer
+from wireup.ioc.base_container import _NOT_FOUND, BaseContainer
 
 if sys.version_info < (3, 9):
     from graphlib2 import TopologicalSorter
@@ -83,7 +83,7 @@ class DependencyContainer(BaseContainer):
         :param klass: Class of the dependency already registered in the container.
         :return: An instance of the requested object. Always returns an existing instance when one is available.
         """
-        if res := self._overrides.get((klass, qualifier)):
+        if self._overrides and (res := self._overrides.get((klass, qualifier), _NOT_FOUND)) is not _NOT_FOUND:
             return res  # type: ignore[no-any-return]
 
         if self._registry.is_interface_known(klass):
@@ -243,7 +243,8 @@ class DependencyContainer(BaseContainer):
         sorter = TopologicalSorter(self._registry.get_dependency_graph())
 
         for klass in sorter.static_order():
-            for qualifier in self._registry.known_impls[klass]:
+            # Singletons initialized only through the context are part of the graph without being registered.
+            for qualifier in self._registry.known_impls.get(klass, ()):
                 if (klass, qualifier) not in self._initialized_objects:
                     self.get(klass, qualifier)
 
@@ -313,7 +314,7 @@ class DependencyContainer(BaseContainer):
 
         ctor, resolved_type, factory_type = ctor_and_type
 
-        if factory_type == FactoryType.ASYNC_GENERATOR:
+        if factory_type is FactoryType.ASYNC_GENERATOR:
             msg = "Cannot construct async objects fron a non-async context."
             raise WireupError(msg)
 
@@ -321,7 +322,7 @@ class DependencyContainer(BaseContainer):
         instance_or_generator = ctor(**injection_result.kwargs)
         object_identifier = resolved_type, qualifier
 
-        if factory_type == FactoryType.GENERATOR:
+        if factory_type is FactoryType.GENERATOR:
             generator = instance_or_generator
             instance = next(instance_or_generator)
         else:
@@ -350,7 +351,7 @@ class DependencyContainer(BaseContainer):
             generator = instance_or_generator
             instance = (
                 next(instance_or_generator)
-                if factory_type == FactoryType.GENERATOR
+                if factory_type is FactoryType.GENERATOR
                 else await instance_or_generator.__anext__()
             )
         else:
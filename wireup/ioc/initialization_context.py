@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,25 +14,24 @@ class InitializationContext:
     Container uses this to determine what to inject for each target.
     """
 
-    __slots__ = ("__dependencies", "__dependencies_view", "__lifetime", "__lifetime_view")
+    __slots__ = ("__dependencies", "__lifetime")
 
     def __init__(self) -> None:
         """Create a new InitializationContext."""
+        # These are read on every injection so they are exposed as-is instead of through a MappingProxyType.
+        # The Mapping return type of the properties marks them as read-only.
         self.__dependencies: dict[AutowireTarget, dict[str, AnnotatedParameter]] = {}
-        self.__dependencies_view = MappingProxyType(self.__dependencies)
-
         self.__lifetime: dict[AutowireTarget, ServiceLifetime] = {}
-        self.__lifetime_view = MappingProxyType(self.__lifetime)
 
     @property
     def lifetime(self) -> Mapping[AutowireTarget, ServiceLifetime]:
-        """Read-only view of service lifetime mapping."""
-        return self.__lifetime_view
+        """Service lifetime mapping. Must not be modified directly."""
+        return self.__lifetime
 
     @property
     def dependencies(self) -> Mapping[AutowireTarget, dict[str, AnnotatedParameter]]:
-        """Read-only view of the dependency definitions."""
-        return self.__dependencies_view
+        """Dependency definitions for each target. Use the methods of this class to modify it."""
+        return self.__dependencies
 
     def init_target(self, target: AutowireTarget, lifetime: ServiceLifetime | None = None) -> bool:
         """Initialize the context for a particular target.
@@ -63,6 +61,7 @@ class InitializationContext:
 
         Target must have been already initialized prior to calling this.
         """
+        # Concurrent autowire calls may still be iterating the current dict, so replace it instead of mutating it.
         self.__dependencies[target] = {k: v for k, v in self.__dependencies[target].items() if k not in names_to_remove}
 
     def remove_dependency_type(self, target: AutowireTarget, type_to_remove: type) -> None:
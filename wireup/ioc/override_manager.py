@@ -1,14 +1,35 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, Iterator
+import functools
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar
 
 from wireup.errors import UnknownOverrideRequestedError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from types import TracebackType
 
-    from wireup.ioc.types import Qualifier, ServiceOverride
+    from wireup.ioc.types import ContainerObjectIdentifier, Qualifier, ServiceOverride
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class OverrideContext(Protocol):
+    """Context manager applying overrides for its duration. Can also be used as a decorator."""
+
+    def __enter__(self) -> None:
+        """Apply the overrides."""
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Remove the overrides applied on enter."""
+
+    def __call__(self, func: F) -> F:
+        """Decorate `func` so that the overrides are active while it runs."""
 
 
 class OverrideManager:
@@ -16,38 +37,65 @@ class OverrideManager:
 
     def __init__(
         self,
-        active_overrides: dict[tuple[type, Qualifier], Any],
+        active_overrides: dict[ContainerObjectIdentifier, Any],
         is_valid_override: Callable[[type, Qualifier], bool],
     ) -> None:
         self.__is_valid_override = is_valid_override
         self.__active_overrides = active_overrides
+        # Every applied override in the order it was set. This allows nested overrides of the same service
+        # to be unwound in LIFO order, restoring whichever override was active before.
+        self.__override_stack: list[tuple[ContainerObjectIdentifier, Any]] = []
+        # Registrations cannot be removed from the container, so once a target is known to be valid it stays valid.
+        self.__valid_overrides: set[ContainerObjectIdentifier] = set()
 
     def set(self, target: type, new: Any, qualifier: Qualifier | None = None) -> None:
         """Override the `target` service with `new`.
 
         Subsequent autowire calls to `target` will result in `new` being injected.
 
+        Overrides of the same service stack rather than replace each other. Each call should be paired with a call
+        to `delete`, which restores the override that was active before it. An override that is never deleted is
+        kept until `clear` is called.
+
         :param target: The target service to override.
         :param qualifier: The qualifier of the service to override. Set this if service is registered
         with the qualifier parameter set to a value.
         :param new: The new object to be injected instead of `target`.
         """
-        if not self.__is_valid_override(target, qualifier):
-            raise UnknownOverrideRequestedError(klass=target, qualifier=qualifier)
-
-        self.__active_overrides[target, qualifier] = new
+        obj_id = self.__get_valid_obj_id(target, qualifier)
+        self.__override_stack.append((obj_id, new))
+        self.__active_overrides[obj_id] = new
 
     def delete(self, target: type, qualifier: Qualifier | None = None) -> None:
-        """Clear active override for the `target` service."""
-        if (target, qualifier) in self.__active_overrides:
-            del self.__active_overrides[target, qualifier]
+        """Clear the most recent override for the `target` service.
+
+        If `target` was overridden more than once, the override that was active before it is restored.
+        """
+        obj_id = target, qualifier
+        stack = self.__override_stack
+
+        # Overrides are usually removed in LIFO order, so the match is almost always found at the end.
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i][0] == obj_id:
+                del stack[i]
+                break
+        else:
+            return
+
+        for j in range(i - 1, -1, -1):
+            prev_obj_id, prev_new = stack[j]
+            if prev_obj_id == obj_id:
+                self.__active_overrides[obj_id] = prev_new
+                return
+
+        del self.__active_overrides[obj_id]
 
     def clear(self) -> None:
         """Clear active service overrides."""
+        self.__override_stack.clear()
         self.__active_overrides.clear()
 
-    @contextmanager
-    def service(self, target: type, new: Any, qualifier: Qualifier | None = None) -> Iterator[None]:
+    def service(self, target: type, new: Any, qualifier: Qualifier | None = None) -> OverrideContext:
         """Override the `target` service with `new` for the duration of the context manager.
 
         Subsequent autowire calls to `target` will result in `new` being injected.
@@ -57,19 +105,98 @@ class OverrideManager:
         with the qualifier parameter set to a value.
         :param new: The new object to be injected instead of `target`.
         """
-        try:
-            self.set(target, new, qualifier)
-            yield
-        finally:
-            self.delete(target, qualifier)
-
-    @contextmanager
-    def services(self, overrides: list[ServiceOverride]) -> Iterator[None]:
+        return _ServiceOverrideContext(self, target, new, qualifier)
+
+    def services(self, overrides: list[ServiceOverride]) -> OverrideContext:
         """Override a number of services with new for the duration of the context manager."""
-        try:
-            for override in overrides:
-                self.set(override.target, override.new, override.qualifier)
-            yield
-        finally:
-            for override in overrides:
-                self.delete(override.target, override.qualifier)
+        return _ServicesOverrideContext(self, overrides)
+
+    def _set_many(self, overrides: list[ServiceOverride]) -> None:
+        """Apply all `overrides` at once. Nothing is applied if any of them is invalid."""
+        # Validate everything upfront so that either all overrides are applied or none are.
+        records = [
+            (self.__get_valid_obj_id(override.target, override.qualifier), override.new) for override in overrides
+        ]
+        self.__override_stack.extend(records)
+        self.__active_overrides.update(records)
+
+    def __get_valid_obj_id(self, target: type, qualifier: Qualifier | None) -> ContainerObjectIdentifier:
+        obj_id = target, qualifier
+
+        if obj_id not in self.__valid_overrides:
+            if not self.__is_valid_override(target, qualifier):
+                raise UnknownOverrideRequestedError(klass=target, qualifier=qualifier)
+
+            self.__valid_overrides.add(obj_id)
+
+        return obj_id
+
+
+# Context managers returned by OverrideManager.service/services.
+# These are plain classes rather than @contextmanager generators as they are entered very frequently in tests.
+# Decorator support is implemented here instead of inheriting from ContextDecorator, which has no __slots__.
+class _OverrideContext(ABC):
+    __slots__ = ("_override_mgr",)
+
+    def __init__(self, override_mgr: OverrideManager) -> None:
+        self._override_mgr = override_mgr
+
+    @abstractmethod
+    def __enter__(self) -> None: ...
+
+    @abstractmethod
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None: ...
+
+    def __call__(self, func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self:
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+class _ServiceOverrideContext(_OverrideContext):
+    __slots__ = ("_target", "_new", "_qualifier")
+
+    def __init__(self, override_mgr: OverrideManager, target: type, new: Any, qualifier: Qualifier | None) -> None:
+        super().__init__(override_mgr)
+        self._target = target
+        self._new = new
+        self._qualifier = qualifier
+
+    def __enter__(self) -> None:
+        self._override_mgr.set(self._target, self._new, self._qualifier)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._override_mgr.delete(self._target, self._qualifier)
+
+
+class _ServicesOverrideContext(_OverrideContext):
+    __slots__ = ("_overrides",)
+
+    def __init__(self, override_mgr: OverrideManager, overrides: list[ServiceOverride]) -> None:
+        super().__init__(override_mgr)
+        self._overrides = overrides
+
+    def __enter__(self) -> None:
+        self._override_mgr._set_many(self._overrides)  # noqa: SLF001
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        for override in reversed(self._overrides):
+            self._override_mgr.delete(override.target, override.qualifier)
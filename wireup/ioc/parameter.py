@@ -1,14 +1,39 @@
 from __future__ import annotations
 
-import re
-from collections import defaultdict
-from re import Match
+import functools
 from typing import Any
 
 from wireup.errors import UnknownParameterError
 from wireup.ioc.types import ParameterReference, TemplatedString
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_template(val: str) -> tuple[str, tuple[str, ...]]:
+    """Convert a templated string into a `str.format` pattern and the names of the parameters it references.
+
+    Placeholders become positional fields so that parameter names are never interpreted by `str.format`.
+    """
+    literals: list[str] = []
+    names: list[str] = []
+    start = 0
+
+    # Let's accept anything as a name here as we don't impose any rules when adding params.
+    while (placeholder_start := val.find("${", start)) != -1:
+        placeholder_end = val.find("}", placeholder_start + 2)
+
+        # An unterminated placeholder is kept as a literal.
+        if placeholder_end == -1:
+            break
+
+        literals.append(val[start:placeholder_start])
+        names.append(val[placeholder_start + 2 : placeholder_end])
+        start = placeholder_end + 1
+
+    literals.append(val[start:])
+
+    return "{}".join(literal.replace("{", "{{").replace("}", "}}") for literal in literals), tuple(names)
+
+
 class ParameterBag:
     """Parameter flat key-value store for use with a container.
 
@@ -17,21 +42,17 @@ class ParameterBag:
 
     """
 
-    __slots__ = ("__bag", "__cache", "__param_cache")
+    __slots__ = ("__bag", "__cache")
 
     def __init__(self) -> None:
         """Initialize an empty ParameterBag.
 
         ParameterBag holds a flat key-value store of parameter values.
         __bag: A dictionary to store parameter values.
-        __cache: A cache for interpolated values.
-        __param_cache: A dictionary to keep track of which cache entries involve each parameter.
+        __cache: A cache for interpolated values. Cleared whenever a parameter is updated.
         """
         self.__bag: dict[str, Any] = {}
         self.__cache: dict[str, str] = {}
-        # __param_cache is used to invalidate cache entries related to specific parameters.
-        # It maps parameter names to the set of cache entry keys that involve that parameter.
-        self.__param_cache: dict[str, set[str]] = defaultdict(set)
 
     def put(self, name: str, val: Any) -> None:
         """Put a parameter value into the bag. This overwrites any previous values.
@@ -40,8 +61,9 @@ class ParameterBag:
         :param val: The value of the parameter.
         """
         self.__bag[name] = val
-        # Clear cache entries involving this parameter name
-        self.__clear_cache_for_name(name)
+        # Parameters are generally only set during configuration, so there is no need to track which
+        # cache entries involve which parameter. Templates stay compiled so re-interpolating them is cheap.
+        self.__cache.clear()
 
     def get_all(self) -> dict[str, Any]:
         """Get all parameters stored in the bag.
@@ -73,33 +95,29 @@ class ParameterBag:
             self.put(name, value)
 
     def __get_value_from_name(self, name: str) -> Any:
-        if name not in self.__bag:
-            raise UnknownParameterError(name)
-
-        return self.__bag[name]
+        try:
+            return self.__bag[name]
+        except KeyError:
+            raise UnknownParameterError(name) from None
 
     def __interpolate(self, val: str) -> str:
         if val in self.__cache:
             return self.__cache[val]
 
-        def replace_param(match: Match[str]) -> str:
-            param_name = match.group(1)
-            param_value = str(self.__get_value_from_name(param_name))
+        # Templates without any placeholders need no further processing.
+        if "${" not in val:
+            self.__cache[val] = val
+            return val
 
-            # Populate __param_cache with the parameter name involved in this cache entry
-            self.__param_cache[param_name].add(val)
+        pattern, names = _compile_template(val)
+        bag = self.__bag
 
-            return param_value
+        try:
+            values = [bag[name] for name in names]
+        except KeyError as e:
+            raise UnknownParameterError(e.args[0]) from None
 
-        # Let's accept anything here as we don't impose any rules when adding params
-        res = re.sub(r"\${(.*?)}", replace_param, val, flags=re.DOTALL)
+        res = pattern.format(*map(str, values))
         self.__cache[val] = res
 
         return res
-
-    def __clear_cache_for_name(self, name: str) -> None:
-        """Clear cache entries that involve the specified parameter name."""
-        for key in self.__param_cache[name]:
-            del self.__cache[key]
-
-        del self.__param_cache[name]
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import inspect
 import typing
-from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
@@ -16,7 +15,13 @@ from wireup.errors import (
 )
 from wireup.ioc.initialization_context import InitializationContext
 from wireup.ioc.types import AnnotatedParameter, AutowireTarget, ServiceLifetime
-from wireup.ioc.util import _get_globals, ensure_is_type, is_type_autowireable, param_get_annotation
+from wireup.ioc.util import (
+    _get_globals,
+    _get_signature_parameters,
+    ensure_is_type,
+    is_type_autowireable,
+    param_get_annotation,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -35,29 +40,40 @@ class FactoryType(Enum):
     ASYNC_GENERATOR = auto()
 
 
-GENERATOR_FACTORY_TYPES = {FactoryType.GENERATOR, FactoryType.ASYNC_GENERATOR}
+# A tuple rather than a set: membership is checked by identity first, which avoids hashing the enum members.
+GENERATOR_FACTORY_TYPES = (FactoryType.GENERATOR, FactoryType.ASYNC_GENERATOR)
 
 
 @dataclass
 class ServiceFactory:
+    __slots__ = ("factory", "factory_type")
     factory: Callable[..., Any]
     factory_type: FactoryType
 
 
+def _get_code_flags(fn: Callable[..., Any]) -> int:
+    # Read the flags once instead of going through one inspect.is*function call per kind of function.
+    fn = getattr(fn, "__func__", fn)
+
+    return fn.__code__.co_flags if inspect.isfunction(fn) else 0
+
+
 def _function_get_unwrapped_return_type(fn: Callable[..., T]) -> tuple[type[T], FactoryType] | None:
     if ret := fn.__annotations__.get("return"):
-        ret = ensure_is_type(ret, globalns=_get_globals(fn))
+        # Only string annotations need evaluating, so avoid resolving the factory's globals otherwise.
+        if isinstance(ret, str):
+            ret = ensure_is_type(ret, globalns=_get_globals(fn))
         if not ret:
             return None
 
-        is_gen = inspect.isgeneratorfunction(fn)
-        if is_gen or inspect.isasyncgenfunction(fn):
+        code_flags = _get_code_flags(fn)
+        if code_flags & (inspect.CO_GENERATOR | inspect.CO_ASYNC_GENERATOR):
             args = typing.get_args(ret)
 
             if not args:
                 return None
 
-            return args[0], FactoryType.GENERATOR if is_gen else FactoryType.ASYNC_GENERATOR
+            return args[0], FactoryType.GENERATOR if code_flags & inspect.CO_GENERATOR else FactoryType.ASYNC_GENERATOR
 
         return ret, FactoryType.REGULAR
 
@@ -71,7 +87,7 @@ class ServiceRegistry:
 
     def __init__(self) -> None:
         self.known_interfaces: dict[type, dict[Qualifier, type]] = {}
-        self.known_impls: dict[type, set[Qualifier]] = defaultdict(set)
+        self.known_impls: dict[type, set[Qualifier]] = {}
         self.factory_functions: dict[tuple[type, Qualifier], ServiceFactory] = {}
 
         self.context = InitializationContext()
@@ -82,20 +98,26 @@ class ServiceRegistry:
         qualifier: Qualifier | None,
         lifetime: ServiceLifetime,
     ) -> None:
+        """Register klass as a service.
+
+        If the direct base class of klass is a known interface, klass is also registered as its implementation.
+        Interfaces further up the class hierarchy are not considered.
+        """
         if self.is_type_with_qualifier_known(klass, qualifier):
             raise DuplicateServiceRegistrationError(klass, qualifier)
 
-        if klass.__base__ and self.is_interface_known(klass.__base__):
-            if qualifier in self.known_interfaces[klass.__base__]:
+        base = klass.__base__
+        if base and (interface_impls := self.known_interfaces.get(base)) is not None:
+            if qualifier in interface_impls:
                 raise DuplicateQualifierForInterfaceError(klass, qualifier)
 
-            self.known_interfaces[klass.__base__][qualifier] = klass
+            interface_impls[qualifier] = klass
 
-        self.known_impls[klass].add(qualifier)
+        self.known_impls.setdefault(klass, set()).add(qualifier)
         self.target_init_context(klass, lifetime)
 
     def register_abstract(self, klass: type) -> None:
-        self.known_interfaces[klass] = defaultdict()
+        self.known_interfaces[klass] = {}
 
     def register_factory(
         self,
@@ -121,7 +143,7 @@ class ServiceRegistry:
             factory=fn,
             factory_type=factory_type,
         )
-        self.known_impls[return_type].add(qualifier)
+        self.known_impls.setdefault(return_type, set()).add(qualifier)
 
         # The target and its lifetime just needs to be known. No need to check its dependencies
         # as the factory will be the one to create it.
@@ -136,8 +158,10 @@ class ServiceRegistry:
         if not self.context.init_target(target, lifetime):
             return
 
-        for name, parameter in inspect.signature(target).parameters.items():
-            annotated_param = param_get_annotation(parameter, globalns=_get_globals(target))
+        globalns = _get_globals(target)
+
+        for name, parameter in _get_signature_parameters(target):
+            annotated_param = param_get_annotation(parameter, globalns=globalns)
 
             if not annotated_param:
                 continue
@@ -162,6 +186,11 @@ class ServiceRegistry:
         }
         types_created_by_factories = set(factory_to_type.values())
         res: dict[type, set[type[Any]]] = {}
+        get_class_deps = self._get_class_deps
+        # Collect singletons up front so that filtering dependencies is a single set intersection per target.
+        singletons = {
+            service for service, lifetime in self.context.lifetime.items() if lifetime is ServiceLifetime.SINGLETON
+        }
 
         for target, dependencies in self.context.dependencies.items():
             # If this type is being created by a factory then do not process the current entry
@@ -171,23 +200,24 @@ class ServiceRegistry:
 
             klass: type[Any] = factory_to_type.get(target, target)  # type: ignore[arg-type]
 
-            if not self.is_impl_singleton(klass):
+            if klass not in singletons:
                 continue
 
-            res[klass] = {cls for cls in self._get_class_deps(dependencies.values()) if self.is_impl_singleton(cls)}
+            res[klass] = get_class_deps(dependencies.values()) & singletons
 
         return res
 
     def _get_class_deps(self, dependencies: Iterable[AnnotatedParameter]) -> set[type[Any]]:
         """Return a set with non-parameter dependencies from the given annotated parameter list."""
         current_deps: set[type[Any]] = set()
+        known_interfaces = self.known_interfaces
 
         for annotated_param in dependencies:
             if annotated_param.is_parameter or not annotated_param.klass:
                 continue
 
-            if self.is_interface_known(annotated_param.klass):
-                current_deps.update(self.known_interfaces.get(annotated_param.klass, {}).values())
+            if (impls := known_interfaces.get(annotated_param.klass)) is not None:
+                current_deps.update(impls.values())
             else:
                 current_deps.add(annotated_param.klass)
         return current_deps
@@ -202,11 +232,11 @@ class ServiceRegistry:
 
     def is_type_with_qualifier_known(self, klass: type, qualifier: Qualifier | None) -> bool:
         """Determine if klass+qualifier is known. Klass can be a concrete class or one registered as abstract."""
-        is_known_impl = self.is_impl_with_qualifier_known(klass, qualifier)
-        is_known_intf = self.__is_interface_with_qualifier_known(klass, qualifier)
-        is_known_from_factory = self.is_impl_known_from_factory(klass, qualifier)
-
-        return is_known_impl or is_known_intf or is_known_from_factory
+        return (
+            self.is_impl_with_qualifier_known(klass, qualifier)
+            or self.__is_interface_with_qualifier_known(klass, qualifier)
+            or self.is_impl_known_from_factory(klass, qualifier)
+        )
 
     def __is_interface_with_qualifier_known(
         self,
@@ -219,7 +249,7 @@ class ServiceRegistry:
         return (klass, qualifier) in self.factory_functions
 
     def is_impl_singleton(self, klass: type) -> bool:
-        return self.context.lifetime.get(klass) == ServiceLifetime.SINGLETON
+        return self.context.lifetime.get(klass) is ServiceLifetime.SINGLETON
 
     def is_interface_known(self, klass: type) -> bool:
         return klass in self.known_interfaces
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import typing
 import warnings
-from inspect import Parameter
+from inspect import Parameter, signature
 from typing import Any, TypeVar
 
 from wireup.errors import WireupError
@@ -83,6 +84,15 @@ def _get_globals(obj: type[Any] | Callable[..., Any]) -> dict[str, Any]:
     return obj.__globals__
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_signature_parameters(target: Callable[..., Any]) -> tuple[tuple[str, Parameter], ...]:
+    """Return the name and parameter pairs of the target's signature.
+
+    Building a signature is expensive and the same targets are commonly registered with more than one container.
+    """
+    return tuple(signature(target).parameters.items())
+
+
 T = TypeVar("T")
 
 